@@ -53,7 +53,7 @@ subareas = ['Belltown']
 # Indicating to get occupancies from June 2017. Edit this to what you want.
 months_get_loads = [6]
 years_get_loads = [2017]
-months_years_get_loads = zip(months_get_loads, years_get_loads)
+months_years_get_loads = list(zip(months_get_loads, years_get_loads))
 
 filenames_get_loads = [filenames[months_years.index(val)] for val in months_years if val in months_years_get_loads]
 
@@ -74,7 +74,7 @@ file_paths = [belltown_path]
 # Indicating aggregate from June 2017. Edit this to what you want.
 months_aggregate = [6]
 years_aggregate = [2017]
-months_years_aggregate = zip(months_aggregate, years_aggregate)
+months_years_aggregate = list(zip(months_aggregate, years_aggregate))
 
 # Aggregating to 1 hour occupancy data and converting to new format for future analysis.
 load_sdot_utils.aggregate_loads(start_hour, end_hour, minute_interval, months_years_aggregate, file_paths)
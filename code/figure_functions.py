@@ -88,7 +88,8 @@ def plot_neighborhoods(element_keys, data_path, fig_path, filename='neighborhood
     area_info = pd.read_csv(os.path.join(data_path, 'paystation_info.csv'))
     area_info = area_info[['ELMNTKEY', 'PAIDAREA', 'SUBAREA']]
 
-    all_keys = area_info['ELMNTKEY'].unique().tolist()
+    # Indexing the area of each block-face once instead of scanning the table for every key.
+    area_lookup = area_info.drop_duplicates('ELMNTKEY').set_index('ELMNTKEY')[['PAIDAREA', 'SUBAREA']]
 
     colors = iter(['navy', 'orangered', 'g', 'r', 'm', 'k', 'orange', 'teal',
                    'purple', 'firebrick', 'gold', 'limegreen', 'gray'])
@@ -101,8 +102,8 @@ def plot_neighborhoods(element_keys, data_path, fig_path, filename='neighborhood
         lat1, lat2 = curr_block[1], curr_block[-2]
         lon1, lon2 = curr_block[0], curr_block[-3]
 
-        if key in all_keys:
-            area = area_info.loc[area_info['ELMNTKEY'] == key]['PAIDAREA'].unique().tolist()[0]
+        if key in area_lookup.index:
+            area = area_lookup.loc[key, 'PAIDAREA']
 
             if area not in area_dict:
                 area_dict[area] = next(colors)
@@ -130,7 +131,9 @@ def plot_paid_areas(element_keys, data_path, fig_path, filename='paidarea_map.ht
     
     area_info = pd.read_csv(os.path.join(data_path, 'paystation_info.csv'))
     area_info = area_info[['ELMNTKEY', 'PAIDAREA', 'SUBAREA']]
-    all_keys = area_info['ELMNTKEY'].unique().tolist()
+
+    # Indexing the area of each block-face once instead of scanning the table for every key.
+    area_lookup = area_info.drop_duplicates('ELMNTKEY').set_index('ELMNTKEY')[['PAIDAREA', 'SUBAREA']]
 
     colors = iter(['navy', 'orangered', 'g', 'm', 'k', 'orange', 'teal',
                    'purple', 'firebrick', 'gold', 'limegreen', 'gray'])
@@ -143,9 +146,9 @@ def plot_paid_areas(element_keys, data_path, fig_path, filename='paidarea_map.ht
         lat1, lat2 = curr_block[1], curr_block[-2]
         lon1, lon2 = curr_block[0], curr_block[-3]
 
-        if key in all_keys:
-            neighborhood = area_info.loc[area_info['ELMNTKEY'] == key]['PAIDAREA'].unique().tolist()[0]
-            subarea = area_info.loc[area_info['ELMNTKEY'] == key]['SUBAREA'].unique().tolist()[0]
+        if key in area_lookup.index:
+            neighborhood = area_lookup.loc[key, 'PAIDAREA']
+            subarea = area_lookup.loc[key, 'SUBAREA']
             area = (neighborhood, subarea)
 
             if area not in area_dict:
@@ -237,7 +240,7 @@ def interpolation(loads, gps_loc, time, fig_path, filename='interpolation.png',
     mp = MapOverlay(up_left, bottom_right, img_size)
 
     # Translating GPS coordinates to pixel positions.
-    pix_pos = np.array([mp.to_image_pixel_position(list(gps_loc[i, :])) for i in xrange(len(gps_loc))])
+    pix_pos = np.array([mp.to_image_pixel_position(list(gps_loc[i, :])) for i in range(len(gps_loc))])
 
     plt.figure(figsize=(18, 16))
     if back_fig_name == 'belltown':
@@ -282,7 +285,7 @@ def interpolation(loads, gps_loc, time, fig_path, filename='interpolation.png',
 
     # Converting labels for color bar to be occupancy percentage.
     old_labels = cbar.ax.get_yticklabels()
-    new_labels = map(lambda label: str(int(float(label.get_text())*100)) + '%', old_labels)
+    new_labels = list(map(lambda label: str(int(float(label.get_text())*100)) + '%', old_labels))
     cbar.ax.set_yticklabels(new_labels)
 
     # Resizing text properties.
@@ -295,7 +298,7 @@ def interpolation(loads, gps_loc, time, fig_path, filename='interpolation.png',
     days = {0:'Monday', 1:'Tuesday', 2:'Wednesday', 3:'Thursday', 4:'Friday', 5:'Saturday'}
     num_times = loads.shape[1]
 
-    hour = 8 + (time % (num_times/6))
+    hour = 8 + (time % (num_times//6))
     if hour < 12:
         hour = str(hour) + ':00 AM'
     elif hour == 12:
@@ -303,7 +306,7 @@ def interpolation(loads, gps_loc, time, fig_path, filename='interpolation.png',
     else:
         hour = str(hour - 12) + ':00 PM'
 
-    day = time/(num_times/6)
+    day = time//(num_times//6)
 
     ax.axes.get_xaxis().set_ticks([])
     ax.axes.get_yaxis().set_ticks([])
@@ -339,7 +342,7 @@ def triangular_grid(loads, gps_loc, time, fig_path, filename='triangle.png', sho
     mp = MapOverlay(up_left, bottom_right, img_size)
 
     # Translating GPS coordinates to pixel positions.
-    pix_pos = np.array([mp.to_image_pixel_position(list(gps_loc[i, :])) for i in xrange(len(gps_loc))])
+    pix_pos = np.array([mp.to_image_pixel_position(list(gps_loc[i, :])) for i in range(len(gps_loc))])
 
     plt.figure(figsize=(18, 16))
     if back_fig_name == 'belltown':
@@ -379,7 +382,7 @@ def triangular_grid(loads, gps_loc, time, fig_path, filename='triangle.png', sho
 
     # Converting labels for color bar to be occupancy percentage.
     old_labels = cbar.ax.get_yticklabels()
-    new_labels = map(lambda label: str(int(float(label.get_text())*100)) + '%', old_labels)
+    new_labels = list(map(lambda label: str(int(float(label.get_text())*100)) + '%', old_labels))
     cbar.ax.set_yticklabels(new_labels)
 
     # Resizing text properties.
@@ -392,7 +395,7 @@ def triangular_grid(loads, gps_loc, time, fig_path, filename='triangle.png', sho
     days = {0:'Monday', 1:'Tuesday', 2:'Wednesday', 3:'Thursday', 4:'Friday', 5:'Saturday'}
     num_times = loads.shape[1]
 
-    hour = 8 + (time % (num_times/6))
+    hour = 8 + (time % (num_times//6))
     if hour < 12:
         hour = str(hour) + ':00 AM'
     elif hour == 12:
@@ -400,7 +403,7 @@ def triangular_grid(loads, gps_loc, time, fig_path, filename='triangle.png', sho
     else:
         hour = str(hour - 12) + ':00 PM'
 
-    day = time/(num_times/6)
+    day = time//(num_times//6)
 
     ax.axes.get_xaxis().set_ticks([])
     ax.axes.get_yaxis().set_ticks([])
@@ -438,7 +441,7 @@ def contour_plot(loads, gps_loc, time, fig_path, contours=10, filename='contours
     mp = MapOverlay(up_left, bottom_right, img_size)
 
     # Translating GPS coordinates to pixel positions.
-    pix_pos = np.array([mp.to_image_pixel_position(list(gps_loc[i, :])) for i in xrange(len(gps_loc))])
+    pix_pos = np.array([mp.to_image_pixel_position(list(gps_loc[i, :])) for i in range(len(gps_loc))])
 
     plt.figure(figsize=(18, 16))
 
@@ -479,7 +482,7 @@ def contour_plot(loads, gps_loc, time, fig_path, contours=10, filename='contours
 
     # Converting labels for color bar to be occupancy percentage.
     old_labels = cbar.ax.get_yticklabels()
-    new_labels = map(lambda label: str(int(float(label.get_text())*100)) + '%', old_labels)
+    new_labels = list(map(lambda label: str(int(float(label.get_text())*100)) + '%', old_labels))
     cbar.ax.set_yticklabels(new_labels)
 
     # Resizing text properties.
@@ -492,7 +495,7 @@ def contour_plot(loads, gps_loc, time, fig_path, contours=10, filename='contours
     days = {0:'Monday', 1:'Tuesday', 2:'Wednesday', 3:'Thursday', 4:'Friday', 5:'Saturday'}
     num_times = loads.shape[1]
 
-    hour = 8 + (time % (num_times/6))
+    hour = 8 + (time % (num_times//6))
     if hour < 12:
         hour = str(hour) + ':00 AM'
     elif hour == 12:
@@ -500,7 +503,7 @@ def contour_plot(loads, gps_loc, time, fig_path, contours=10, filename='contours
     else:
         hour = str(hour - 12) + ':00 PM'
 
-    day = time/(num_times/6)
+    day = time//(num_times//6)
 
     ax.axes.get_xaxis().set_ticks([])
     ax.axes.get_yaxis().set_ticks([])
@@ -534,7 +537,7 @@ def voronoi(gps_loc, fig_path, filename='voronoi.png', show_fig=False):
     mp = MapOverlay(up_left, bottom_right, img_size)
 
     # Translating GPS coordinates to pixel positions.
-    pix_pos = np.array([mp.to_image_pixel_position(list(gps_loc[i, :])) for i in xrange(len(gps_loc))])
+    pix_pos = np.array([mp.to_image_pixel_position(list(gps_loc[i, :])) for i in range(len(gps_loc))])
 
     plt.figure(figsize=(18, 16))
     ax = plt.axes(xlim=(min(pix_pos[:, 0]), max(pix_pos[:, 0])),
@@ -801,7 +804,7 @@ def temporal_day_plots(loads, fig_path, filename='temporal_day_plots.png', show_
     num_times = loads.shape[1]
 
     # List of lists, where each inner list contains the indexes for a day.
-    days = [[i for i in xrange(j, j+(num_times/6))] for j in xrange(0, num_times, (num_times/6))]
+    days = [[i for i in range(j, j+(num_times//6))] for j in range(0, num_times, (num_times//6))]
 
     day_dict = {1: 'Monday', 2: 'Tuesday', 3: 'Wednesday', 4: 'Thursday',
                 5: 'Friday', 6: 'Saturday'}
@@ -809,7 +812,7 @@ def temporal_day_plots(loads, fig_path, filename='temporal_day_plots.png', show_
     day_count = 1
 
     for day in days:
-        bins = range(8, (num_times/6) + 8)
+        bins = range(8, (num_times//6) + 8)
 
         # Getting the mean loads for the hours of the given day and scaling for plot.
         counts = np.nanmean(loads, axis=0)[day] * 100
@@ -868,7 +871,7 @@ def temporal_hour_plots(loads, fig_path, filename='temporal_hour_plots.png', sho
     num_times = loads.shape[1]
 
     num_rows = 2
-    num_cols = (num_times/6)/2
+    num_cols = (num_times//6)//2
     plt.subplots(nrows=num_rows, ncols=num_cols, figsize=(7*num_cols, 21))
 
     # Setting block-faces with negligible load to nan so they are ignored when getting mean.
@@ -876,7 +879,7 @@ def temporal_hour_plots(loads, fig_path, filename='temporal_hour_plots.png', sho
         loads[loads <= .05] = np.nan
 
     # List of lists, where each inner list contains the indexes for an hour of the day.
-    hours = [[j + i*(num_times/6) for i in xrange(6)] for j in xrange((num_times/6))]
+    hours = [[j + i*(num_times//6) for i in range(6)] for j in range((num_times//6))]
 
     hour_count = 1
 
@@ -978,7 +981,7 @@ def temporal_change_plot(loads1, loads2, element_keys1, element_keys2,
     loads_avg_pos = []
     loads_avg_neg = []
 
-    for j in xrange(loads.shape[1]):
+    for j in range(loads.shape[1]):
         # Computing the mean amount blocks increased of those that did increase.
         loads_avg_pos.append(np.nanmean(loads[loads_pos[:, j], j]))
 
@@ -1234,7 +1237,7 @@ def mixture_plot(loads, gps_loc, times, fig_path, num_comps=4,
     mp = MapOverlay(up_left, bottom_right, img_size)
 
     # Translating GPS coordinates to pixel positions.
-    pix_pos = np.array([mp.to_image_pixel_position(list(gps_loc[i, :])) for i in xrange(len(gps_loc))])
+    pix_pos = np.array([mp.to_image_pixel_position(list(gps_loc[i, :])) for i in range(len(gps_loc))])
 
     # Setting center of image.
     center = ((up_left[0] - bottom_right[0])/2., (up_left[1] - bottom_right[1])/2.)
@@ -1254,7 +1257,7 @@ def mixture_plot(loads, gps_loc, times, fig_path, num_comps=4,
         fig = plt.figure(figsize=(18*shape[1], 16*shape[0]))
         fs = 70
     
-    for fig_count in xrange(1, num_figs+1):
+    for fig_count in range(1, num_figs+1):
         
         if shape is None:
             ax = fig.add_subplot(1, num_figs, fig_count)
@@ -1297,7 +1300,7 @@ def mixture_plot(loads, gps_loc, times, fig_path, num_comps=4,
 
         # Setting up the ellipses for the mixture components.
         patches = [Ellipse(xy=(0, 0), width=0, height=0, angle=0, edgecolor='black', 
-                   facecolor='none', lw='4') for comp in xrange(2*num_comps)]
+                   facecolor='none', lw='4') for comp in range(2*num_comps)]
         ellipses = [ax.add_patch(patches[comp]) for comp in range(2*num_comps)]
 
         # Getting the data and normalizing the features.
@@ -1310,8 +1313,11 @@ def mixture_plot(loads, gps_loc, times, fig_path, num_comps=4,
                                       covariance_type='diag').fit(cluster_data)
 
         # Scaling the mean and covariances back to GPS coordinates.
-        means = np.vstack(([(mean[1:] - scaler.min_[1:])/(scaler.scale_[1:]) for mean in gmm.means_]))
-        covs = np.dstack(([np.diag((cov[1:])/(scaler.scale_[1:]**2)) for cov in gmm.covariances_])).T
+        means = (gmm.means_[:, 1:] - scaler.min_[1:])/scaler.scale_[1:]
+        covs_diag = gmm.covariances_[:, 1:]/(scaler.scale_[1:]**2)
+        covs = np.zeros(covs_diag.shape + covs_diag.shape[1:])
+        diag = np.arange(covs_diag.shape[1])
+        covs[:, diag, diag] = covs_diag
 
         # Getting the labels by choosing the component which maximizes the posterior probability.
         labels = gmm.predict(cluster_data)
@@ -1321,9 +1327,9 @@ def mixture_plot(loads, gps_loc, times, fig_path, num_comps=4,
             colors = ['blue', 'deeppink', 'aqua', 'lawngreen']
             color_codes = {}
 
-            for i in xrange(num_comps):
+            for i in range(num_comps):
                 # Finding the default centroid closest to the current centroid.
-                dists = [(j, np.linalg.norm(means[i] - default_means[j])) for j in xrange(num_comps)]
+                dists = [(j, np.linalg.norm(means[i] - default_means[j])) for j in range(num_comps)]
                 best_colors = sorted(dists, key=lambda item:item[1])
 
                 # Finding the color that is unused that is closest to the current centroid.
@@ -1335,16 +1341,16 @@ def mixture_plot(loads, gps_loc, times, fig_path, num_comps=4,
                 color_codes[i] = choice
         else:
             colors = [plt.cm.gist_rainbow(i) for i in np.linspace(0, 1, num_comps)]
-            color_codes = {i:i for i in xrange(num_comps)}
+            color_codes = {i:i for i in range(num_comps)}
 
         # Setting the cluster colors based off of the labels.
-        scatter.set_color([colors[color_codes[labels[i]]] for i in xrange(len(labels))])
-        scatter.set_edgecolor(['black' for i in xrange(len(labels))])
+        scatter.set_color([colors[color_codes[labels[i]]] for i in range(len(labels))])
+        scatter.set_edgecolor(['black' for i in range(len(labels))])
 
         ellipse_num = 0
 
         # Updating the ellipses for each of the components.
-        for i in xrange(num_comps):
+        for i in range(num_comps):
             lambda_, v = np.linalg.eig(covs[i])
             lambda_ = np.sqrt(lambda_)
 
@@ -1375,12 +1381,12 @@ def mixture_plot(loads, gps_loc, times, fig_path, num_comps=4,
                 ellipse_num += 1
 
         # Converting the centroids to pixel positions from GPS coords.
-        pix_means = np.array([mp.to_image_pixel_position(list(means[i, :])) for i in xrange(len(means))])
+        pix_means = np.array([mp.to_image_pixel_position(list(means[i, :])) for i in range(len(means))])
 
         # Updating the centroids for the animations.
         scatter_centroid.set_offsets(pix_means)
 
-        hour = 8 + (time % (num_times/6))
+        hour = 8 + (time % (num_times//6))
         if hour < 12:
             hour = str(hour) + ':00 AM'
         elif hour == 12:
@@ -1388,7 +1394,7 @@ def mixture_plot(loads, gps_loc, times, fig_path, num_comps=4,
         else:
             hour = str(hour - 12) + ':00 PM'
 
-        day = time/(num_times/6)
+        day = time//(num_times//6)
 
         days = {0:'Monday', 1:'Tuesday', 2:'Wednesday', 3:'Thursday', 4:'Friday', 5:'Saturday'}
         if caption:
@@ -1442,7 +1448,7 @@ def centroid_plots(centers, gps_loc, times, fig_path, num_comps,
     mp = MapOverlay(up_left, bottom_right, img_size)
 
     # Translating GPS coordinates to pixel positions.
-    pix_pos = np.array([mp.to_image_pixel_position(list(gps_loc[i, :])) for i in xrange(len(gps_loc))])
+    pix_pos = np.array([mp.to_image_pixel_position(list(gps_loc[i, :])) for i in range(len(gps_loc))])
 
     num_times = len(centers)
     
@@ -1458,7 +1464,7 @@ def centroid_plots(centers, gps_loc, times, fig_path, num_comps,
         fig = plt.figure(figsize=(18*shape[1], 16*shape[0]))
         fs = 35
 
-    for fig_count in xrange(1, num_figs+1):
+    for fig_count in range(1, num_figs+1):
         
         if shape is None:
             ax = fig.add_subplot(1, num_figs, fig_count)
@@ -1495,7 +1501,7 @@ def centroid_plots(centers, gps_loc, times, fig_path, num_comps,
         labels = kmeans.labels_.tolist()
 
         # Translating the centroid GPS coordinates to pixel positions.
-        data_pix_pos = np.array([mp.to_image_pixel_position(list(data[i, :])) for i in xrange(len(data))])
+        data_pix_pos = np.array([mp.to_image_pixel_position(list(data[i, :])) for i in range(len(data))])
 
         # Adding in the centroids to the map as points.
         scatter = ax.scatter(data_pix_pos[:, 0], data_pix_pos[:, 1], s=500, color='red', edgecolor='black')
@@ -1507,11 +1513,11 @@ def centroid_plots(centers, gps_loc, times, fig_path, num_comps,
             colors = [plt.cm.gist_rainbow(i) for i in np.linspace(0, 1, num_comps)]
 
         # Setting the centroid colors to be the same within a cluster.
-        scatter.set_color([colors[labels[i]] for i in xrange(len(labels))])
-        scatter.set_edgecolor(['black' for i in xrange(len(labels))])
+        scatter.set_color([colors[labels[i]] for i in range(len(labels))])
+        scatter.set_edgecolor(['black' for i in range(len(labels))])
 
-        hour = 8 + (time % (num_times/6))
-        day = time/(num_times/6)
+        hour = 8 + (time % (num_times//6))
+        day = time//(num_times//6)
 
         if hour < 12:
             hour = str(hour) + ':00 AM'
@@ -1569,7 +1575,7 @@ def centroid_radius(centroids, all_time_points, gps_loc, times, fig_path,
     num_times = centroids.shape[0]
 
     # Translating GPS coordinates to pixel positions.
-    pix_pos = np.array([mp.to_image_pixel_position(list(gps_loc[i, :])) for i in xrange(len(gps_loc))])
+    pix_pos = np.array([mp.to_image_pixel_position(list(gps_loc[i, :])) for i in range(len(gps_loc))])
 
     if isinstance(times, list):
         num_figs = len(times)
@@ -1583,7 +1589,7 @@ def centroid_radius(centroids, all_time_points, gps_loc, times, fig_path,
         fig = plt.figure(figsize=(18*shape[1], 16*shape[0]))
         fs = 35
 
-    for fig_count in xrange(1, num_figs+1):
+    for fig_count in range(1, num_figs+1):
 
         if shape is None:
             ax = fig.add_subplot(1, num_figs, fig_count)
@@ -1619,21 +1625,21 @@ def centroid_radius(centroids, all_time_points, gps_loc, times, fig_path,
                                       color='red', edgecolor='black')
 
         # Adding in the circle around each centroid having radius of average distance to centroid of all points.
-        for comp in xrange(centroids.shape[1]):
+        for comp in range(centroids.shape[1]):
             path = np.array([list(mp.to_image_pixel_position(all_time_points[time, comp, i])) 
-                             for i in xrange(all_time_points.shape[2])])
+                             for i in range(all_time_points.shape[2])])
             
             poly = plt.Polygon(path, fill=None, edgecolor='black', lw=4)
             
             ax.add_patch(poly)
 
         # Converting the centroids to pixel positions from GPS coords.
-        pix_means = np.array([mp.to_image_pixel_position(list(centroids[time, i])) for i in xrange(centroids.shape[1])])
+        pix_means = np.array([mp.to_image_pixel_position(list(centroids[time, i])) for i in range(centroids.shape[1])])
 
         # Updating the centroid locations.
         scatter_centroid.set_offsets(pix_means)
 
-        hour = 8 + (time % (num_times/6))
+        hour = 8 + (time % (num_times//6))
         if hour < 12:
             hour = str(hour) + ':00 AM'
         elif hour == 12:
@@ -1641,7 +1647,7 @@ def centroid_radius(centroids, all_time_points, gps_loc, times, fig_path,
         else:
             hour = str(hour - 12) + ':00 PM'
 
-        day = time/(num_times/6)
+        day = time//(num_times//6)
 
         days = {0:'Monday', 1:'Tuesday', 2:'Wednesday', 3:'Thursday', 4:'Friday', 5:'Saturday'}
         ax.set_xlabel(days[day] + ' ' + hour)
@@ -1685,14 +1691,14 @@ def model_selection(loads, gps_loc, fig_path, show_fig=False):
     num_times = loads.shape[1]
 
     # Fitting mixture models at each possible time the loads are available.
-    for time in xrange(num_times):
+    for time in range(num_times):
 
         likelihoods = []
         bics = []
         aics = []
 
         # Varying the number of components and getting AIC, BIC, and likelihood.
-        for num_comps in xrange(min_comps, max_comps):
+        for num_comps in range(min_comps, max_comps):
 
             # Dropping block-faces with nan (closed) or negligible load.
             mask = ((~np.isnan(loads[:, time])) & (~(loads[:, time] <= 0.05)))
@@ -5,12 +5,15 @@ from collections import defaultdict
 import moran_auto
 import itertools
 import multiprocessing
-import functools
+from concurrent.futures import ThreadPoolExecutor
+import os
 import warnings
+from threadpoolctl import threadpool_limits
 warnings.filterwarnings('ignore')
 
 
-def locational_demand_analysis(park_data, gps_loc, num_comps, k, area_map, verbose=True):
+def locational_demand_analysis(park_data, gps_loc, num_comps, k, area_map, verbose=True,
+                               use_threads=False):
     """Find GMM consistency and spatial autocorrelation at each day of the week and time of day.
 
     This function finds the consistency of the GMM fit over time and also
@@ -27,6 +30,9 @@ def locational_demand_analysis(park_data, gps_loc, num_comps, k, area_map, verbo
     :param k: Integer or list containing number of neighbors to use for the Moran weighting matrix.
     :param area_map: Dictionary from key to subarea.
     :param verbose: Bool indicator of whether to print progress.
+    :param use_threads: Bool indicator of whether to run each day and hour in a
+    thread of this process, which shares the data instead of sending it to
+    worker processes but only overlaps the work done outside of the GIL.
 
     :return results: List containing the tuple of results returned from
     locational_demand_one_time at each instance.
@@ -37,11 +43,32 @@ def locational_demand_analysis(park_data, gps_loc, num_comps, k, area_map, verbo
 
     times = list(itertools.product(days, hours))
 
-    pool = multiprocessing.Pool()
+    # Splitting the data by day and hour up front so each worker is only sent its own slice.
+    data_by_day_hour = {day_hour: data for day_hour, data in park_data.groupby(['Day', 'Hour'])}
 
-    func = functools.partial(locational_demand_one_time, park_data, 
-                             gps_loc, times, num_comps, k, area_map, verbose)
-    results = pool.map(func, range(len(times)))
+    args = [(data_by_day_hour[(day, hour)], gps_loc, day, hour, num_comps, k, area_map, verbose)
+            for day, hour in times]
+
+    if use_threads:
+        # Limiting BLAS to a single thread per worker thread to avoid oversubscription.
+        with threadpool_limits(1, 'blas'), ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(locational_demand_one_time, *zip(*args)))
+
+        return results
+
+    # Workers are started from a fork server since forking a process which has already
+    # initialized OpenMP (e.g. through scikit-learn) can deadlock the workers.
+    os.environ.setdefault('OMP_NUM_THREADS', '1')
+
+    try:
+        context = multiprocessing.get_context('forkserver')
+    except ValueError:
+        # Windows has no fork server.
+        context = multiprocessing
+
+    pool = context.Pool(initializer=init_worker)
+
+    results = pool.starmap(locational_demand_one_time, args)
 
     pool.close()
     pool.join()
@@ -49,20 +76,28 @@ def locational_demand_analysis(park_data, gps_loc, num_comps, k, area_map, verbo
     return results
 
 
-def locational_demand_one_time(park_data, gps_loc, times, num_comps, 
-                               k_vals, area_map, verbose, iteration):
+def init_worker():
+    """Limit each worker process to a single BLAS and OpenMP thread to avoid oversubscription."""
+
+    threadpool_limits(1)
+
+
+def locational_demand_one_time(data_df, gps_loc, day, hour, num_comps, 
+                               k_vals, area_map, verbose):
     """Find GMM consistency and spatial autocorrelation at one day of the week and time of day.
 
     
-    :param park_data: Multi-index DataFrame containing datetimes in the first
-    level index and block-face keys in the second level index. Values include
-    the corresponding loads.
+    :param data_df: Multi-index DataFrame containing datetimes in the first
+    level index and block-face keys in the second level index for only the
+    given day and hour. Values include the corresponding loads.
     :param gps_loc: Numpy array with each row containing the lat, long pair
     midpoints for a block-face.
-    :param times: List of tuples, with each tuple containing day and hour pair.
+    :param day: Integer day of week.
+    :param hour: Integer hour of the day.
     :param num_comps: Integer number of mixture components for the model.
     :param k_vals: Integer or list of number of neighbors to use for the Moran weighting matrix.
-    :param iteration: Integer iteration number of the multiprocessing.
+    :param area_map: Dictionary from key to subarea.
+    :param verbose: Bool indicator of whether to print progress.
 
 
     day, hour, time_avg_consistency, morans_mixture, morans_dist_mixture, \
@@ -113,16 +148,18 @@ def locational_demand_one_time(park_data, gps_loc, times, num_comps,
     :return centers: List of numpy arrays of the centroids of each fit.
     """
 
-    time = times[iteration]
-    day = time[0]
-    hour = time[1]
-
     if verbose:
         print('Starting day %d and hour %d' % (day, hour))
 
-    # Getting the data for the current day and hour combination.
-    data_df = park_data.loc[(park_data['Day'] == day) & (park_data['Hour'] == hour)]
     block_keys = sorted(data_df.index.get_level_values(1).unique().tolist())
+    key_to_pos = {key: i for i, key in enumerate(block_keys)}
+    date_times = data_df.index.get_level_values(0).unique().tolist()
+
+    # Splitting the data by date once, dropping block-faces which were closed or had no supply.
+    data_by_time = {}
+    for date_time, time_data in data_df.groupby(level=0):
+        time_data = time_data.reset_index(level=0, drop=True).dropna()
+        data_by_time[date_time] = (time_data.index.values, time_data['Load'].values)
 
     average_consistencies = []
     centers = [] 
@@ -134,45 +171,50 @@ def locational_demand_one_time(park_data, gps_loc, times, num_comps,
     morans_dist_mixture = []
     gmm_vars = []
     sdot_vars = []
+    area_weights = {}
 
-    for train_time in data_df.index.get_level_values(0).unique().tolist():
-        train_data = data_df.xs(train_time, level=0)
-
-        # Dropping block-faces which were closed or had no supply.
-        train_data = train_data.dropna()
+    for train_time in date_times:
+        train_index, train_load_values = data_by_time[train_time]
 
-        N = len(train_data)
+        N = len(train_index)
 
-        train_active_index = train_data.index.tolist()
-        train_mask = [block_keys.index(train_active_index[i]) for i in xrange(len(train_active_index))]  
-        train_to_label_map = {train_active_index[i]: i for i in xrange(len(train_active_index))}
+        train_active_index = train_index.tolist()
+        train_mask = np.fromiter((key_to_pos[key] for key in train_active_index),
+                                 dtype=np.intp, count=len(train_active_index))
+        train_to_label_map = {train_active_index[i]: i for i in range(len(train_active_index))}
 
         # Getting the data and normalizing the features.
-        train_loads = train_data['Load'].values.reshape((-1, 1))
+        train_loads = train_load_values.reshape((-1, 1))
         train = np.hstack((train_loads, gps_loc[train_mask]))
         scaler = MinMaxScaler().fit(train)
         train = scaler.transform(train)
 
-        # Fitting the mixture model.
-        gmm = mixture.GaussianMixture(n_init=10, n_components=num_comps,
-                                      covariance_type='diag').fit(train)
+        # Fitting the mixture model, with each restart initialized from k-means.
+        gmm = mixture.GaussianMixture(n_init=3, n_components=num_comps,
+                                      covariance_type='diag', init_params='kmeans').fit(train)
 
         # Scaling the mean back to GPS coordinates and saving the centroids.
-        means = np.vstack(([(mean[1:] - scaler.min_[1:])/(scaler.scale_[1:]) for mean in gmm.means_]))
+        means = (gmm.means_[:, 1:] - scaler.min_[1:])/scaler.scale_[1:]
         centers.append(means)
 
         # Getting the labels by choosing the component which maximizes the posterior probability.
         train_labels = gmm.predict(train)
 
+        # Grouping block-faces by subarea, leaving out block-faces which are not in the area map.
         subarea_to_key = defaultdict(list)
-        for key in train_active_index:
-            subarea_to_key[area_map[key]].append(train_active_index.index(key))
+        for i, key in enumerate(train_active_index):
+            if key in area_map:
+                subarea_to_key[area_map[key]].append(i)
+
+        # The load deviations, their S3 sum and the Moran expectation are shared by all of the weight matrices.
+        z = train_loads[:, 0] - train_loads[:, 0].mean()
+        bottom = np.dot(z, z)
+        s_3 = moran_auto.moran_kurtosis(z, N)
+        expectation = moran_auto.moran_expectation(N)
 
         # Getting spatial correlation statistics for Moran's I using mixture component connections.
-        weights = moran_auto.get_mixture_weights(train_labels, N)        
-        I = moran_auto.moran_I(train_loads[:, 0], N, weights)
-        expectation = moran_auto.moran_expectation(N)
-        variance = moran_auto.moran_variance(train_loads[:, 0], weights, N)
+        I, W, s_1, s_2 = moran_auto.moran_stats_from_groups(z, bottom, N, train_labels)
+        variance = moran_auto.moran_variance_from_sums(N, W, s_1, s_2, s_3, expectation)
         z_score = moran_auto.z_score(I, expectation, variance)
         p_one_sided, p_two_sided = moran_auto.p_value(z_score)
 
@@ -180,19 +222,23 @@ def locational_demand_one_time(park_data, gps_loc, times, num_comps,
 
         # Getting spatial correlation statistics for Moran's I using mixture component distance connections.
         weights = moran_auto.get_dist_mixture_weights(train_labels, gps_loc[train_mask], N)        
-        I = moran_auto.moran_I(train_loads[:, 0], N, weights)
-        expectation = moran_auto.moran_expectation(N)
-        variance = moran_auto.moran_variance(train_loads[:, 0], weights, N)
+        I = moran_auto.moran_I_deviations(z, bottom, N, weights)
+        variance = moran_auto.moran_variance(train_loads[:, 0], weights, N,
+                                              s_3=s_3, expectation=expectation)
         z_score = moran_auto.z_score(I, expectation, variance)
         p_one_sided, p_two_sided = moran_auto.p_value(z_score)
 
         morans_dist_mixture.append([I, expectation, variance, z_score, p_one_sided, p_two_sided])
 
         # Getting spatial correlation statistics for Moran's I using paid area connections.
-        weights = moran_auto.get_area_weights(train_active_index, N, area_map, subarea_to_key)        
-        I = moran_auto.moran_I(train_loads[:, 0], N, weights)
-        expectation = moran_auto.moran_expectation(N)
-        variance = moran_auto.moran_variance(train_loads[:, 0], weights, N)
+        # The paid area weights only depend on the active block-faces, so they are reused across dates.
+        active_signature = tuple(train_active_index)
+        if active_signature not in area_weights:
+            area_weights[active_signature] = moran_auto.get_area_weights(subarea_to_key, N)
+        weights = area_weights[active_signature]
+        I = moran_auto.moran_I_deviations(z, bottom, N, weights)
+        variance = moran_auto.moran_variance(train_loads[:, 0], weights, N, symmetric=True,
+                                              s_3=s_3, expectation=expectation)
         z_score = moran_auto.z_score(I, expectation, variance)
         p_one_sided, p_two_sided = moran_auto.p_value(z_score)
 
@@ -200,9 +246,9 @@ def locational_demand_one_time(park_data, gps_loc, times, num_comps,
 
         # Getting spatial correlation statistics for Moran's I using paid area distance connections.
         weights = moran_auto.get_dist_area_weights(train_active_index, gps_loc[train_mask], N, area_map, subarea_to_key)        
-        I = moran_auto.moran_I(train_loads[:, 0], N, weights)
-        expectation = moran_auto.moran_expectation(N)
-        variance = moran_auto.moran_variance(train_loads[:, 0], weights, N)
+        I = moran_auto.moran_I_deviations(z, bottom, N, weights)
+        variance = moran_auto.moran_variance(train_loads[:, 0], weights, N,
+                                              s_3=s_3, expectation=expectation)
         z_score = moran_auto.z_score(I, expectation, variance)
         p_one_sided, p_two_sided = moran_auto.p_value(z_score)
 
@@ -210,9 +256,9 @@ def locational_demand_one_time(park_data, gps_loc, times, num_comps,
 
         # Getting spatial correlation statistics for Moran's I using distance connections.
         weights = moran_auto.get_dist_weights(gps_loc[train_mask], N)        
-        I = moran_auto.moran_I(train_loads[:, 0], N, weights)
-        expectation = moran_auto.moran_expectation(N)
-        variance = moran_auto.moran_variance(train_loads[:, 0], weights, N)
+        I = moran_auto.moran_I_deviations(z, bottom, N, weights)
+        variance = moran_auto.moran_variance(train_loads[:, 0], weights, N,
+                                              s_3=s_3, expectation=expectation)
         z_score = moran_auto.z_score(I, expectation, variance)
         p_one_sided, p_two_sided = moran_auto.p_value(z_score)
 
@@ -221,16 +267,16 @@ def locational_demand_one_time(park_data, gps_loc, times, num_comps,
         # Getting spatial correlation statistics for Moran's I using nearest neighbor connections.
         for k in k_vals:
             weights = moran_auto.get_neighbor_weights(gps_loc[train_mask], N, k)
-            I = moran_auto.moran_I(train_loads[:, 0], N, weights)
-            expectation = moran_auto.moran_expectation(N)
-            variance = moran_auto.moran_variance(train_loads[:, 0], weights, N)
+            I = moran_auto.moran_I_deviations(z, bottom, N, weights)
+            variance = moran_auto.moran_variance(train_loads[:, 0], weights, N,
+                                                  s_3=s_3, expectation=expectation)
             z_score = moran_auto.z_score(I, expectation, variance)
             p_one_sided, p_two_sided = moran_auto.p_value(z_score)
 
             morans_neighbor[k].append([I, expectation, variance, z_score, p_one_sided, p_two_sided])
 
         # Finding variance of occupancy within GMM zones.
-        gmm_var = np.array([train_loads[np.where(train_labels==comp)[0]].var() for comp in xrange(num_comps)]).mean()
+        gmm_var = np.array([train_loads[np.where(train_labels==comp)[0]].var() for comp in range(num_comps)]).mean()
         gmm_vars.append(gmm_var)
 
         # Finding variance of occupancy within current paid parking zones.
@@ -240,24 +286,22 @@ def locational_demand_one_time(park_data, gps_loc, times, num_comps,
         consistencies = []
 
         # For each other day of data, get labels of new data using model that was fit.
-        for test_time in data_df.index.get_level_values(0).unique().tolist():
+        for test_time in date_times:
 
             # Skipping predicting on the time that was trained on.
             if test_time == train_time:
                 continue
 
-            test_data = data_df.xs(test_time, level=0)
-
-            # Dropping block-faces which were closed or had no supply.
-            test_data = test_data.dropna()
+            test_index, test_load_values = data_by_time[test_time]
 
             # Keeping the block-faces which were used in fitting the model.
-            test_data = test_data.loc[test_data.index.isin(train_active_index)]
-            test_active_index = test_data.index.tolist()
-            test_mask = [block_keys.index(test_active_index[i]) for i in xrange(len(test_active_index))]
+            test_keep = np.isin(test_index, train_index)
+            test_active_index = test_index[test_keep].tolist()
+            test_mask = np.fromiter((key_to_pos[key] for key in test_active_index),
+                                    dtype=np.intp, count=len(test_active_index))
 
             # Getting the data and normalizing the features.
-            test_loads = test_data['Load'].values.reshape((-1, 1))
+            test_loads = test_load_values[test_keep].reshape((-1, 1))
             test = np.hstack((test_loads, gps_loc[test_mask]))
             test = scaler.transform(test)
 
@@ -265,19 +309,10 @@ def locational_demand_one_time(park_data, gps_loc, times, num_comps,
             test_labels = gmm.predict(test)
 
             # Next block gets the fraction of block-faces assigned to the same component.
-            same = 0
-            changed = 0
-
-            for i in xrange(len(test_labels)):
-                key = test_active_index[i]
-                idx = train_to_label_map[key]
-
-                if test_labels[i] == train_labels[idx]:
-                    same += 1
-                else:
-                    changed += 1
+            test_key_ids = np.fromiter((train_to_label_map[key] for key in test_active_index),
+                                       dtype=np.intp, count=len(test_active_index))
 
-            consistency = same/float(same + changed)
+            consistency = float((test_labels == train_labels[test_key_ids]).mean())
             consistencies.append(consistency)
 
         # Getting average consistency over all test sets.
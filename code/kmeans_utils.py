@@ -30,7 +30,7 @@ def get_distances(centers, num_comps):
     all_time_dist = []
     all_time_centroids = []
     
-    for time in xrange(len(centers)):
+    for time in range(len(centers)):
         data = np.vstack((centers[time]))
 
         # Clustering the centroids, assigning labels, and getting centroids.
@@ -42,11 +42,11 @@ def get_distances(centers, num_comps):
         current_time_dist = []
         current_time_centroids = []
 
-        for i in xrange(num_comps):
+        for i in range(num_comps):
             curr_points = data[np.where(np.array(labels) == i)[0].tolist()]
 
             dist = np.array([as_the_crow_flies_distance(curr_points[j], centroids[i]) 
-                            for j in xrange(len(curr_points))]).mean()  
+                            for j in range(len(curr_points))]).mean()  
 
             current_time_dist.append(dist)
             current_time_centroids.append(centroids[i])
@@ -108,12 +108,12 @@ def get_centroid_circle_paths(distances, centroids):
     all_time_points = []
 
     # Getting the circle around the centroid for all times for all components.
-    for i in xrange(centroids.shape[0]):
+    for i in range(centroids.shape[0]):
         
         curr_time_points = []
 
         # Getting the destination points for each component at the given time.
-        for j in xrange(centroids.shape[1]):
+        for j in range(centroids.shape[1]):
             lat = centroids[i, j, 0]
             lon = centroids[i, j, 1]
 
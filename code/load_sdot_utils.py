@@ -1,4 +1,4 @@
-import urllib2
+from urllib.request import urlopen
 import datetime
 import pandas as pd
 import numpy as np
@@ -48,7 +48,7 @@ def get_data(month, year, file_path, verbose=False):
         url = url1 + date + url2 + date
     
         # Making API call.
-        response = urllib2.urlopen(url).read()
+        response = urlopen(url).read().decode('utf-8')
         response = response.split('\r\n')
         response = response[:-1]
     
@@ -170,7 +170,7 @@ def get_block_load(date, transactions, key, supply):
     if not ((supply == 0).any()):
         percentage[0, :] = 1.0*load[0, :]/supply
         
-    output = zip(percentage, load)
+    output = list(zip(percentage, load))
 
     return output
 
@@ -194,7 +194,7 @@ def get_loads(month, year, subarea, block_info, transactions, data_path):
                   7: 'Jul', 8: 'Aug', 9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'}
 
     # Creating directory for the loads to be written to if it does not exist.
-    subarea_dir = data_path + os.sep + subarea.translate(None, string.punctuation).replace(' ', '') + '_Minute'
+    subarea_dir = data_path + os.sep + subarea.translate(str.maketrans('', '', string.punctuation)).replace(' ', '') + '_Minute'
     if not os.path.exists(subarea_dir):
         os.makedirs(subarea_dir)
 
@@ -310,17 +310,17 @@ def aggregate_loads(start_hour, end_hour, minute_interval, months_years, file_pa
             interval_data = []
 
             # Aggregate from 1 minute intervals to specified interval.
-            for i in xrange(0, 1440, minute_interval):
+            for i in range(0, 1440, minute_interval):
                 interval = data.loc[i:i+minute_interval-1]
                 interval_avg = interval.values.mean(axis=0)
                 interval_data.append(interval_avg)
 
             interval_data = np.vstack((interval_data))
-            interval_data = interval_data[start_hour*(60/minute_interval):end_hour*(60/minute_interval)]
+            interval_data = interval_data[start_hour*(60//minute_interval):end_hour*(60//minute_interval)]
             interval_data = interval_data.T
             interval_data = interval_data.flatten()
                     
-            times = [(hour, minute) for hour in xrange(start_hour, end_hour) for minute in xrange(0, 60, minute_interval)]
+            times = [(hour, minute) for hour in range(start_hour, end_hour) for minute in range(0, 60, minute_interval)]
             
             index = [datetime.datetime(year, month_map[month], int(day), hour, minute, 0) for day in cols.tolist() for hour, minute in times]
 
@@ -120,8 +120,11 @@ def animate(frame, times, ax, scatter, scatter_centroid, patches, ellipses,
                                   covariance_type='diag').fit(cluster_data)
     
     # Scaling the mean and covariances back to GPS coordinates.
-    means = np.vstack(([(mean[1:] - scaler.min_[1:])/(scaler.scale_[1:]) for mean in gmm.means_]))
-    covs = np.dstack(([np.diag((cov[1:])/(scaler.scale_[1:]**2)) for cov in gmm.covariances_])).T
+    means = (gmm.means_[:, 1:] - scaler.min_[1:])/scaler.scale_[1:]
+    covs_diag = gmm.covariances_[:, 1:]/(scaler.scale_[1:]**2)
+    covs = np.zeros(covs_diag.shape + covs_diag.shape[1:])
+    diag = np.arange(covs_diag.shape[1])
+    covs[:, diag, diag] = covs_diag
 
     # Getting the labels by choosing the component which maximizes the posterior probability.
     labels = gmm.predict(cluster_data)    
@@ -190,7 +193,7 @@ def animate(frame, times, ax, scatter, scatter_centroid, patches, ellipses,
     # Updating the centroids for the animations.
     scatter_centroid.set_offsets(pix_means)
 
-    hour = 8 + (time % (num_times/6))
+    hour = 8 + (time % (num_times//6))
     if hour < 12:
         hour = str(hour) + ':00 AM'
     elif hour == 12:
@@ -198,7 +201,7 @@ def animate(frame, times, ax, scatter, scatter_centroid, patches, ellipses,
     else:
         hour = str(hour - 12) + ':00 PM'
 
-    day = time/(num_times/6)
+    day = time//(num_times//6)
 
     days = {0: 'Monday', 1: 'Tuesday', 2: 'Wednesday', 3: 'Thursday',
             4: 'Friday', 5: 'Saturday'}
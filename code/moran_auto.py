@@ -1,5 +1,7 @@
 import numpy as np
 import scipy.stats as st
+from scipy import sparse
+from scipy.spatial import cKDTree
 
 
 def get_neighbor_weights(gps_loc, N, k):
@@ -15,11 +17,15 @@ def get_neighbor_weights(gps_loc, N, k):
 
     weights = np.zeros((N, N))
 
-    for i in xrange(N):
-        # Finding the k-nearest neighbors.
-        neighbors = np.vstack(sorted([(j, np.linalg.norm(gps_loc[i] - gps_loc[j])) for j in xrange(N)],
-                                     key=lambda x: x[1])[1:k+1])[:, 0].astype('int')
-        weights[i, neighbors] = 1
+    # A block-face can have at most N - 1 neighbors.
+    k = min(k, N - 1)
+
+    # Finding the k-nearest neighbors, where the closest point is the block-face itself.
+    _, neighbors = cKDTree(gps_loc).query(gps_loc, k=k+1)
+    neighbors = neighbors.reshape((N, -1))[:, 1:]
+
+    rows = np.repeat(np.arange(N), k)
+    weights[rows, neighbors.ravel()] = 1
 
     return weights
 
@@ -36,7 +42,7 @@ def get_dist_weights(gps_loc, N):
 
     weights = np.zeros((N, N))
 
-    for i in xrange(N):
+    for i in range(N):
         # Computing distance to each sample normalized between 0 and 1.
         dist = np.linalg.norm(gps_loc[i] - gps_loc, axis=1)**2
         dist /= dist.max()
@@ -49,24 +55,17 @@ def get_dist_weights(gps_loc, N):
     return weights
 
 
-def get_area_weights(train_active_index, N, area_map, subarea_to_key):
+def get_area_weights(subarea_to_key, N):
     """Get the weight matrix for Moran I by using the paid area connections.
 
-    :param train_active_index: Numpy array of the active block-face keys.
+    :param subarea_to_key: Dictionary from subarea to the indexes of the
+    block-faces in it. Block-faces not in any subarea have no connections.
     :param N: Integer number of samples (locations).
-    :param area_map: Dictionary from key to subarea.
-    :param subarea_to_key: Dictionary from subarea to key.
 
-    :return weights: Numpy array of the weight matrix.
+    :return weights: Scipy sparse matrix of the weight matrix.
     """
 
-    weights = np.zeros((N, N))
-    for i in xrange(N):
-        # Finding blocks in the same subarea.
-        weights[i, subarea_to_key[area_map[train_active_index[i]]]] = 1
-        
-    di = np.diag_indices(N)
-    weights[di] = 0
+    weights = get_group_weights(subarea_to_key.values(), N)
 
     return weights
 
@@ -78,24 +77,28 @@ def get_dist_area_weights(train_active_index, gps_loc, N, area_map, subarea_to_k
     :param gps_loc: Numpy array with each row containing the lat, long pair
     midpoints for a block-face.
     :param N: Integer number of samples (locations).
-    :param area_map: Dictionary from key to subarea.
+    :param area_map: Dictionary from key to subarea. Block-faces missing from
+    it have no paid area connections.
     :param subarea_to_key: Dictionary from subarea to key.
 
     :return weights: Numpy array of the weight matrix.
     """
 
     weights = np.zeros((N, N))
-    all_idx = range(N)
 
-    for i in xrange(N):
-        # Finding blocks in the same and different areas.
-        same_area = subarea_to_key[area_map[train_active_index[i]]]
-        diff_area = list(set(all_idx) - set(same_area))
+    for i in range(N):
+        # Leaving the row empty for block-faces which are not in a paid area.
+        if train_active_index[i] not in area_map:
+            continue
+
+        # Finding blocks in the same area, with every other block in a different area.
+        same_area = np.zeros(N, dtype=bool)
+        same_area[subarea_to_key[area_map[train_active_index[i]]]] = True
 
         # Computing distance to each block in same subarea normalized between 0 and 1.
         dist = np.linalg.norm(gps_loc[i] - gps_loc, axis=1)**2
         dist /= dist[same_area].max()
-        dist[diff_area] = 1
+        dist[~same_area] = 1
         dist = -1*(1 - dist)
 
         weights[i] = dist
@@ -109,21 +112,52 @@ def get_dist_area_weights(train_active_index, gps_loc, N, area_map, subarea_to_k
 def get_mixture_weights(train_labels, N):
     """Calculate the Moran I weight matrix using the mixture connections.
 
+    The GMM analysis computes the mixture Moran statistics directly from the
+    labels with moran_stats_from_groups, so this is only needed when the weight
+    matrix itself is wanted.
+
     :param train_labels: Numpy array containing label for each data point.
     :param N: Integer number of samples (locations).
 
-    :return weights: Numpy array of the weight matrix.
+    :return weights: Scipy sparse matrix of the weight matrix.
     """
 
-    weights = np.zeros((N, N))
+    groups = [np.where(train_labels == label)[0] for label in np.unique(train_labels)]
+    weights = get_group_weights(groups, N)
 
-    for i in xrange(N):
-        label = train_labels[i]
-        matching = np.where(train_labels == label)[0].tolist()
-        weights[i, matching] = 1
+    return weights
 
-    di = np.diag_indices(N)
-    weights[di] = 0
+
+def get_group_weights(groups, N):
+    """Get the sparse weight matrix connecting each pair of distinct samples in the same group.
+
+    :param groups: Iterable of lists or numpy arrays of the sample indexes in each group.
+    :param N: Integer number of samples (locations).
+
+    :return weights: Scipy sparse matrix of the weight matrix.
+    """
+
+    rows = []
+    cols = []
+
+    for idxs in groups:
+        idxs = np.asarray(idxs, dtype=np.intp)
+        rows.append(np.repeat(idxs, len(idxs)))
+        cols.append(np.tile(idxs, len(idxs)))
+
+    rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.intp)
+    cols = np.concatenate(cols) if cols else np.zeros(0, dtype=np.intp)
+
+    # Dropping the connection of each sample to itself.
+    off_diag = rows != cols
+    rows = rows[off_diag]
+    cols = cols[off_diag]
+
+    # Ordering the connections by row to build the compressed sparse row structure directly.
+    order = np.argsort(rows, kind='mergesort')
+    indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=N))))
+
+    weights = sparse.csr_matrix((np.ones(len(rows)), cols[order], indptr), shape=(N, N))
 
     return weights
 
@@ -141,17 +175,14 @@ def get_dist_mixture_weights(train_labels, gps_loc, N):
 
     weights = np.zeros((N, N))
 
-    for i in xrange(N):
-        label = train_labels[i]
-
-        # Finding blocks with the same and different label.
-        not_matching = np.where(train_labels != label)[0].tolist()
-        matching = np.where(train_labels == label)[0].tolist()
+    for i in range(N):
+        # Finding blocks with the same label, with every other block having a different label.
+        matching = train_labels == train_labels[i]
 
         # Computing distance to each block in same component normalized between 0 and 1.
         dist = np.linalg.norm(gps_loc[i] - gps_loc, axis=1)**2
         dist /= dist[matching].max()
-        dist[not_matching] = 1
+        dist[~matching] = 1
         dist = -1*(1 - dist)
         weights[i] = dist
 
@@ -166,22 +197,77 @@ def moran_I(x, N, weights):
 
     :param x: Numpy array of the loads.
     :param N: Integer number of samples.
-    :param weights: Numpy array of the weight matrix.
+    :param weights: Numpy array or scipy sparse matrix of the weight matrix.
+
+    :return I: Float of Moran I.
+    """
+
+    z = np.ascontiguousarray(x - x.mean(), dtype=np.float64)
+    bottom = np.dot(z.T, z)
+
+    I = moran_I_deviations(z, bottom, N, weights)
+
+    return I
+
+
+def moran_I_deviations(z, bottom, N, weights):
+    """Calculating the Moran I from the deviations of the loads from their mean.
+
+    This lets the deviations and their sum of squares be computed once and
+    shared by the Moran I of several weight matrices.
+
+    :param z: Numpy array of the loads minus the mean load.
+    :param bottom: Float of the sum of squares of z.
+    :param N: Integer number of samples.
+    :param weights: Numpy array or scipy sparse matrix of the weight matrix.
 
     :return I: Float of Moran I.
     """
 
     W = weights.sum()
-    z = x - x.mean()
 
-    top = sum(weights[i,j]*z[i]*z[j] for i in xrange(N) for j in xrange(N)) 
-    bottom = np.dot(z.T, z)
+    # Bilinear form z^T W z computed as a matrix-vector product then a dot product.
+    top = float(np.dot(z, weights.dot(z)))
 
     I = (N/W) * top/bottom
 
     return I
 
 
+def moran_stats_from_groups(z, bottom, N, train_labels):
+    """Calculating the Moran I and variance sums with the mixture connections without forming the weight matrix.
+
+    The mixture weight matrix connects every pair of distinct blocks sharing a
+    label, so each statistic has a closed form in the label sums of z and the
+    label sizes g: z^T W z is the sum of the squared label sums of z minus the
+    sum of z^2, W is the sum of g(g-1), S1 is twice W, and S2 is the sum of
+    g(2(g-1))^2.
+
+    :param z: Numpy array of the loads minus the mean load.
+    :param bottom: Float of the sum of squares of z.
+    :param N: Integer number of samples.
+    :param train_labels: Numpy array containing label for each data point.
+
+    :return I: Float of Moran I.
+    :return W: Float of the sum of the weights.
+    :return s_1: Float of the S1 sum used in the variance of Moran I.
+    :return s_2: Float of the S2 sum used in the variance of Moran I.
+    """
+
+    sums = np.bincount(train_labels, weights=z)
+    sizes = np.bincount(train_labels).astype(np.float64)
+
+    W = (sizes*(sizes - 1)).sum()
+    s_1 = 2.*W
+    s_2 = (sizes*(2.*(sizes - 1))**2).sum()
+
+    top = (sums*sums).sum() - bottom
+
+    I = (N/W) * top/bottom
+
+    return I, W, s_1, s_2
+
+
 def moran_expectation(N):
     """Calculate the expected value of the Moran I.
 
@@ -195,31 +281,87 @@ def moran_expectation(N):
     return expectation
 
 
-def moran_variance(x, w, N):
+def moran_variance(x, w, N, symmetric=False, s_3=None, expectation=None):
     """Calculating the variance of the Moran I.
     
     :param x: Numpy array of the loads.
-    :param w: Numpy array of the weight matrix.
+    :param w: Numpy array or scipy sparse matrix of the weight matrix.
     :param N: Integer number of samples (locations).
+    :param symmetric: Bool indicator of whether the weight matrix is symmetric,
+    in which case the sums are computed without transposing it.
+    :param s_3: Float of the S3 sum of the loads, computed from x if not given.
+    :param expectation: Float of expectation of Moran I, computed if not given.
 
     :return var: Float of variance of Moran I.
     """
 
+    if not sparse.issparse(w):
+        w = np.ascontiguousarray(w, dtype=np.float64)
+
     W = w.sum()
 
-    z = x - x.mean()
+    row = np.asarray(w.sum(axis=1)).ravel()
+
+    if symmetric:
+        # With w equal to its transpose, S1 is 2 sum(w^2) and the column sums equal the row sums.
+        if sparse.issparse(w):
+            s_1 = 2. * w.power(2).sum()
+        else:
+            s_1 = 2. * np.square(w).sum()
+
+        s_2 = 4. * np.square(row).sum()
+    else:
+        if sparse.issparse(w):
+            s_1 = .5 * (w + w.T).power(2).sum()
+        else:
+            s_1 = .5 * np.square(w + w.T).sum()
 
-    s_1 = .5 * sum((w[i,j] + w[j,i])**2 for i in xrange(N) for j in xrange(N))
+        col = np.asarray(w.sum(axis=0)).ravel()
+        s_2 = np.square(row + col).sum()
 
-    s_2 = sum((sum(w[i,j] for j in xrange(N)) + sum(w[j,i] for j in xrange(N)))**2 for i in xrange(N))
+    if s_3 is None:
+        s_3 = moran_kurtosis(x - x.mean(), N)
+
+    if expectation is None:
+        expectation = moran_expectation(N)
+
+    var = moran_variance_from_sums(N, W, s_1, s_2, s_3, expectation)
+
+    return var
+
+
+def moran_kurtosis(z, N):
+    """Calculating the S3 sum (kurtosis of the loads) used in the variance of the Moran I.
+
+    :param z: Numpy array of the loads minus the mean load.
+    :param N: Integer number of samples (locations).
+
+    :return s_3: Float of the S3 sum.
+    """
 
     s_3 = (N**(-1) * (z**4).sum())/(N**(-1) * (z**2).sum())**2
 
+    return s_3
+
+
+def moran_variance_from_sums(N, W, s_1, s_2, s_3, expectation):
+    """Calculating the variance of the Moran I from the sums of the weight matrix.
+
+    :param N: Integer number of samples (locations).
+    :param W: Float of the sum of the weights.
+    :param s_1: Float of the S1 sum of the weight matrix.
+    :param s_2: Float of the S2 sum of the weight matrix.
+    :param s_3: Float of the S3 sum of the loads.
+    :param expectation: Float of expectation of Moran I.
+
+    :return var: Float of variance of Moran I.
+    """
+
     s_4 = (N**2 - 3.*N + 3.)*s_1 - N*s_2 + 3.*W**2
 
     s_5 = (N**2 - N)*s_1 - 2.*N*s_2 + 6.*W**2
 
-    var = ((N*s_4 - s_3*s_5)/((N - 1.) * (N - 2.) * (N - 3.) * W**2)) - moran_expectation(N)**2
+    var = ((N*s_4 - s_3*s_5)/((N - 1.) * (N - 2.) * (N - 3.) * W**2)) - expectation**2
 
     return var
 
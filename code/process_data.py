@@ -53,11 +53,15 @@ def load_data(data_path, load_paths, month_year_start, month_year_end,
             block_info.loc[:, col] = pd.to_datetime(block_info[col])
         else:
             pass
+
+    # Splitting the block-face info by key once so each block-face is a dictionary lookup.
+    block_info_by_key = {key: group for key, group in block_info.groupby('ElementKey')}
+    no_block_info = block_info.iloc[:0]
     
     # Loading holiday information for when paid parking is not available.
     cal = USFederalHolidayCalendar()
     holidays = cal.holidays(start='2012-01-01', end=datetime.datetime.now().date()).to_pydatetime()
-    holidays = [hol.date() for hol in holidays]
+    holidays = set(hol.date() for hol in holidays)
 
     # Getting starting and ending date to keep data for.
     if day_start == None:
@@ -96,18 +100,16 @@ def load_data(data_path, load_paths, month_year_start, month_year_end,
             block_data['Hour'] = block_data['Datetime'].dt.hour
             block_data['Minute'] = block_data['Datetime'].dt.minute
 
-            # Keeping the data in the specified date range.
-            block_data = block_data.loc[(block_data['Date'] >= date_start) & (block_data['Date'] <= date_end)]
-
-            # Getting rid of Sunday since there is no paid parking.
-            block_data = block_data.loc[block_data['Day'] != 6]
-
-            # Dropping the days where the total parking is 0 because of holidays.
-            block_data = block_data.loc[~block_data['Date'].isin(holidays)]
-            block_data.reset_index(inplace=True, drop=True)
+            # Keeping the data in the specified date range, getting rid of Sunday since there is
+            # no paid parking, and dropping the days where the total parking is 0 because of holidays.
+            keep = ((block_data['Date'] >= date_start)
+                    & (block_data['Date'] <= date_end)
+                    & (block_data['Day'] != 6)
+                    & (~block_data['Date'].isin(holidays)))
+            block_data = block_data.loc[keep].reset_index(drop=True)
 
             # Clipping the loads to be no higher than 1.5
-            block_data['Load'] = block_data['Load'].clip_upper(1.5)
+            block_data['Load'] = block_data['Load'].clip(upper=1.5)
 
             # If block contains no data, skip it.
             if len(block_data) == 0:
@@ -137,7 +139,10 @@ def load_data(data_path, load_paths, month_year_start, month_year_end,
                 continue
 
             # Getting block-face info for the current key about hours of operation.
-            curr_block_info = block_info.loc[block_info['ElementKey'] == key]
+            curr_block_info = block_info_by_key.get(key, no_block_info)
+
+            # Midnight of each date, which the peak hour times of day are offset from.
+            dates = pd.to_datetime(block_data['Date'])
 
             # Filling times where paid parking is not allowed for the block with nan.
             for index, row in curr_block_info.iterrows():
@@ -151,8 +156,8 @@ def load_data(data_path, load_paths, month_year_start, month_year_end,
 
                 if not row_null['PeakHourStart1']:
 
-                    start1 = pd.Series([datetime.datetime.combine(block_data.loc[i, 'Date'], row['PeakHourStart1']) for i in xrange(len(block_data))])
-                    end1 = pd.Series([datetime.datetime.combine(block_data.loc[i, 'Date'], row['PeakHourEnd1']) for i in xrange(len(block_data))])
+                    start1 = dates + pd.Timedelta(str(row['PeakHourStart1']))
+                    end1 = dates + pd.Timedelta(str(row['PeakHourEnd1']))
 
                     if row_null['EffectiveEndDate']:
                         mask1 = ((row['EffectiveStartDate'] <= block_data['Datetime'])
@@ -170,8 +175,8 @@ def load_data(data_path, load_paths, month_year_start, month_year_end,
 
                 if not row_null['PeakHourStart2']:
 
-                    start2 = pd.Series([datetime.datetime.combine(block_data.loc[i, 'Date'], row['PeakHourStart2']) for i in xrange(len(block_data))])
-                    end2 = pd.Series([datetime.datetime.combine(block_data.loc[i, 'Date'], row['PeakHourEnd2']) for i in xrange(len(block_data))])
+                    start2 = dates + pd.Timedelta(str(row['PeakHourStart2']))
+                    end2 = dates + pd.Timedelta(str(row['PeakHourEnd2']))
 
                     if row_null['EffectiveEndDate']:
                         mask2 = ((row['EffectiveStartDate'] <= block_data['Datetime'])
@@ -189,10 +194,8 @@ def load_data(data_path, load_paths, month_year_start, month_year_end,
 
                 if not row_null['PeakHourStart3']:
 
-                    start3 = pd.Series([datetime.datetime.combine(block_data.loc[i, 'Date'], row['PeakHourStart3'])
-                                        for i in xrange(len(block_data))])
-                    end3 = pd.Series([datetime.datetime.combine(block_data.loc[i, 'Date'], row['PeakHourEnd3'])
-                                      for i in xrange(len(block_data))])
+                    start3 = dates + pd.Timedelta(str(row['PeakHourStart3']))
+                    end3 = dates + pd.Timedelta(str(row['PeakHourEnd3']))
 
                     if row_null['EffectiveEndDate']:
                         mask3 = ((row['EffectiveStartDate'] <= block_data['Datetime'])
@@ -224,7 +227,7 @@ def load_data(data_path, load_paths, month_year_start, month_year_end,
     avg_loads = np.vstack((avg_loads))
     gps_loc = np.vstack((gps_loc))
 
-    index = park_data[park_data.keys()[0]].groupby(['Day', 'Hour']).sum().index
+    index = park_data[next(iter(park_data))].groupby(['Day', 'Hour']).sum().index
 
     days = index.get_level_values(0).unique().values
     days = np.sort(days)
@@ -240,7 +243,7 @@ def load_data(data_path, load_paths, month_year_start, month_year_end,
         park_data[key] = park_data[key].set_index('Datetime')
 
     # Merging the dataframes into multi-index dataframe.
-    park_data = pd.concat(park_data.values(), keys=park_data.keys())
+    park_data = pd.concat(list(park_data.values()), keys=list(park_data.keys()))
 
     park_data.index.names = ['ID', 'Datetime']
 
@@ -275,8 +278,7 @@ def get_price_changes(area, data_path):
     price_changes = defaultdict(list)
     time_changes = defaultdict(list)
 
-    for key in area['ElementKey'].unique():
-        block = area.loc[area['ElementKey'] == key]
+    for key, block in area.groupby('ElementKey', sort=False):
         block = block.dropna(subset=['WeekdayRate1'])
         block = block.sort_values(by='EffectiveStartDate')
 
@@ -286,7 +288,7 @@ def get_price_changes(area, data_path):
                               'StartTimeSaturday', 'EndTimeSaturday']].values
         dates = block.loc[:, ['EffectiveStartDate', 'EffectiveEndDate']].values
 
-        for i in xrange(len(block)-1):
+        for i in range(len(block)-1):
             if not np.array_equal(prices[i], prices[i+1]):
                 price_changes[(dates[i+1,0], dates[i,0])].append((key, prices[i]-prices[i+1]))
             if not np.array_equal(times[i], times[i+1]):
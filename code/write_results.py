@@ -23,7 +23,7 @@ def write_gmm_results(consistencies, results_path, filename='consistencies.csv')
     consistency_results = np.vstack((consistency_results, hourly))
     consistency_results = np.hstack((consistency_results, daily.reshape((-1, 1))))
 
-    columns = range(8, 8 + d) + ['Average Daily']
+    columns = list(range(8, 8 + d)) + ['Average Daily']
     index = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Average Hourly']
 
     consistency_results = pd.DataFrame(consistency_results, index=index, columns=columns)
@@ -46,9 +46,9 @@ def write_moran_results(days, hours, morans, p_value, results_path):
     :return p_two_side_sig_avg: Float percentage of significant two sided p value instances.
     """
 
-    I = [[morans[j][i][0] for i in xrange(len(morans[j]))] for j in xrange(len(morans))]
-    one_sided = [[morans[j][i][4] for i in xrange(len(morans[j]))] for j in xrange(len(morans))]
-    two_sided = [[morans[j][i][5] for i in xrange(len(morans[j]))] for j in xrange(len(morans))]
+    I = [[morans[j][i][0] for i in range(len(morans[j]))] for j in range(len(morans))]
+    one_sided = [[morans[j][i][4] for i in range(len(morans[j]))] for j in range(len(morans))]
+    two_sided = [[morans[j][i][5] for i in range(len(morans[j]))] for j in range(len(morans))]
 
     index = []
     day_map = {0: 'Monday', 1: 'Tuesday', 2: 'Wednesday', 3: 'Thursday', 4: 'Friday', 5: 'Saturday'}